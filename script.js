@@ -439,7 +439,42 @@ async function fetchCronStatus() {
 async function fetchResourceHistory() {
   const res = await fetch(`resource_history.json?cb=${Date.now()}`, { cache: 'no-store' });
   if (!res.ok) throw new Error(`HTTP ${res.status}`);
-  return await res.json();
+  const h = await res.json();
+
+  // Points newer than the last compaction live in an append-only NDJSON tail.
+  // The two files are fetched separately, so a compaction in between can leave
+  // this refresh with the old JSON and an empty tail (up to ~1h missing); the
+  // next refresh picks the points up from the rewritten JSON.
+  const points = (h && h.points) || [];
+  try {
+    const tailRes = await fetch(`resource_history.ndjson?cb=${Date.now()}`, { cache: 'no-store' });
+    if (tailRes.ok) {
+      const lines = (await tailRes.text()).split('\n');
+      for (const line of lines) {
+        if (!line.trim()) continue;
+        let p = null;
+        try {
+          p = JSON.parse(line);
+        } catch {
+          continue;
+        }
+        if (!p || typeof p.atMs !== 'number') continue;
+        const lastMs = points.length ? points[points.length - 1].atMs || 0 : 0;
+        if (points.length && p.atMs === lastMs) points[points.length - 1] = p;
+        else if (p.atMs > lastMs) points.push(p);
+      }
+    }
+  } catch {
+    // tail is optional
+  }
+
+  if (points.length && h.retentionMs) {
+    const cutoff = points[points.length - 1].atMs - h.retentionMs;
+    const first = points.findIndex((p) => p && (p.atMs || 0) >= cutoff);
+    if (first > 0) points.splice(0, first);
+  }
+  if (h.maxPoints && points.length > h.maxPoints) points.splice(0, points.length - h.maxPoints);
+  return { ...h, points };
 }
 
 function drawLineChart(canvasId, points, valueKey, opts = {}) {
@@ -5,68 +5,170 @@ This script queries Clawdbot cron jobs via the CLI and writes a small,
 front-end-friendly JSON file into this project directory.
 
 Usage:
-  python3 update_cron_data.py
+  python3 update_cron_data.py [--history-only] [--skip-if-fresh SECONDS]
+
+  --history-only          only record a resource_history point; skip the
+                          clawdbot call and leave cron_status.json untouched
+  --skip-if-fresh SECONDS exit immediately if the output was written within
+                          the last SECONDS seconds
 
 Designed to be run periodically (cron/systemd timer).
 
 Outputs:
   - cron_status.json (same directory)
   - resource_history.json (time-series for charts; same directory)
-  - .cpu_state.json (internal state for CPU usage diff; same directory)
+  - resource_history.ndjson (points not yet folded into the JSON; same directory)
+  - .cpu_state (internal state for CPU usage diff; same directory)
+  - .host_cache.json (internal cache of host probes; same directory)
 """
 
 from __future__ import annotations
 
-import json
+import functools
 import os
-import platform
-import shutil
-import subprocess
+import sys
 import time
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any
+from typing import Any, NamedTuple
+
+# platform/shutil/subprocess/datetime are deliberately not imported here: the
+# script runs every minute, so rarely-needed modules are imported on use.
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    import json
+
+    orjson = None
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 OUT_PATH = os.path.join(HERE, "cron_status.json")
-CPU_STATE_PATH = os.path.join(HERE, ".cpu_state.json")
+CPU_STATE_PATH = os.path.join(HERE, ".cpu_state")
+# Pre-.cpu_state JSON format; migrated and removed on first run.
+LEGACY_CPU_STATE_PATH = os.path.join(HERE, ".cpu_state.json")
+HOST_CACHE_PATH = os.path.join(HERE, ".host_cache.json")
 HISTORY_PATH = os.path.join(HERE, "resource_history.json")
+HISTORY_TAIL_PATH = os.path.join(HERE, "resource_history.ndjson")
+
+CRON_CMD = ["clawdbot", "cron", "list", "--all", "--json"]
+CRON_CMD_STR = " ".join(CRON_CMD)
 
 # Keep the dashboard snappy: retain a bounded window of samples.
 # (24h @ 60s interval = 1440 points)
 HISTORY_RETENTION_MS = 24 * 60 * 60 * 1000
 HISTORY_MAX_POINTS = 2000
 
+# New points are appended to resource_history.ndjson and only folded into
+# resource_history.json once this many have accumulated (~1h @ 60s).
+HISTORY_COMPACT_EVERY = 60
+# Charts work at minute granularity: a point in the same minute as the previous
+# one whose cpu/mem moved less than this (percentage points) is not recorded.
+HISTORY_BUCKET_MS = 60 * 1000
+HISTORY_MIN_DELTA_PCT = 0.5
+
+# How long a cached `which vcgencmd` lookup stays valid.
+VCGENCMD_CACHE_TTL_MS = 10 * 60 * 1000
+# Firmware exposes the same bits as `vcgencmd get_throttled` here (hex, no 0x).
+THROTTLED_SYSFS_PATH = "/sys/devices/platform/soc/soc:firmware/get_throttled"
+TEMP_SENSOR_PATHS = (
+    "/sys/class/thermal/thermal_zone0/temp",
+    "/sys/class/hwmon/hwmon0/temp1_input",
+)
+# How long "the preferred temperature sensor does not exist" stays cached.
+TEMP_SKIP_TTL_MS = 10 * 60 * 1000
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_utc(ms: int) -> str:
+    from datetime import datetime, timezone
+
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).isoformat()
+
 
 def _iso(ms: int | None) -> str | None:
+    # Jobs on the same schedule share run timestamps, so formatting is memoized.
     if not ms:
         return None
-    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).isoformat()
+    return _iso_utc(ms)
 
 
-def _read_text(path: str) -> str:
-    with open(path, "r", encoding="utf-8") as f:
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
         return f.read()
 
 
-def _safe_float(v: str) -> float | None:
+def _read_proc(path: str, size: int) -> bytes:
+    """Read at most size bytes from a /proc file with a single read()."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def _loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_atomic(path: str, buf: bytes, sync: bool = False) -> None:
+    """Write buf to path via a temp file + rename, in a single write() call.
+
+    With sync=True the data is flushed with fdatasync() before the rename.
+    """
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(fd, view):]
+        if sync:
+            os.fdatasync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _safe_float(v: str | bytes) -> float | None:
     try:
         return float(v)
     except Exception:
         return None
 
 
-def _safe_int(v: str) -> int | None:
+def _safe_int(v: str | bytes) -> int | None:
     try:
         return int(v)
     except Exception:
         return None
 
 
+def _load_host_cache() -> dict[str, Any]:
+    try:
+        cache = _loads(_read_bytes(HOST_CACHE_PATH))
+        return cache if isinstance(cache, dict) else {}
+    except Exception:
+        return {}
+
+
+def _save_host_cache(cache: dict[str, Any]) -> None:
+    try:
+        _write_atomic(HOST_CACHE_PATH, _dumps(cache) + b"\n")
+    except Exception:
+        pass
+
+
 def _loadavg() -> dict[str, float] | None:
     try:
         # /proc/loadavg: "0.01 0.05 0.15 1/234 5678"
-        parts = _read_text("/proc/loadavg").split()
+        parts = _read_proc("/proc/loadavg", 128).split()
         if len(parts) < 3:
             return None
         one = _safe_float(parts[0])
@@ -79,93 +181,149 @@ def _loadavg() -> dict[str, float] | None:
         return None
 
 
-def _cpu_temp_c() -> float | None:
-    """Try to read CPU temperature in Celsius (common on Raspberry Pi/Linux)."""
-    candidates = [
-        "/sys/class/thermal/thermal_zone0/temp",
-        "/sys/class/hwmon/hwmon0/temp1_input",
-    ]
-    for p in candidates:
+def _read_temp_c(path: str) -> float | None:
+    v = _safe_int(_read_proc(path, 32).strip())
+    if v is None:
+        return None
+    # usually milli-degC
+    if v > 1000:
+        return round(v / 1000.0, 1)
+    return float(v)
+
+
+def _cpu_temp_c(cache: dict[str, Any], now_ms: int) -> float | None:
+    """Try to read CPU temperature in Celsius (common on Raspberry Pi/Linux).
+
+    Sensors are tried in TEMP_SENSOR_PATHS order. If the preferred sensor does
+    not exist, that is remembered in the host cache for TEMP_SKIP_TTL_MS so
+    later runs go straight to the fallback.
+    """
+    primary = TEMP_SENSOR_PATHS[0]
+    skip = cache.get("tempSkip")
+    skip_primary = False
+    if isinstance(skip, dict) and skip.get("path") == primary:
+        # a negative age means the clock stepped back; treat it as expired
+        age_ms = now_ms - (skip.get("checkedAtMs") or 0)
+        skip_primary = 0 <= age_ms < TEMP_SKIP_TTL_MS
+
+    for p in TEMP_SENSOR_PATHS:
+        if skip_primary and p == primary:
+            continue
         try:
-            raw = _read_text(p).strip()
-            v = _safe_int(raw)
-            if v is None:
-                continue
-            # usually milli-degC
-            if v > 1000:
-                return round(v / 1000.0, 1)
-            return float(v)
+            v = _read_temp_c(p)
+        except FileNotFoundError:
+            # only a missing sensor is cached; transient read errors are not
+            if p == primary:
+                cache["tempSkip"] = {"path": primary, "checkedAtMs": now_ms}
+            continue
         except Exception:
             continue
+        if v is not None:
+            return v
+
+    # nothing worked: retry the preferred sensor next time
+    cache.pop("tempSkip", None)
     return None
 
 
-def _run_cmd(cmd: list[str], timeout_s: int = 20) -> tuple[int, str, str]:
+def _run_cmd(cmd: list[str], timeout_s: int = 20) -> tuple[int, bytes, bytes]:
+    """Run cmd and return (returncode, stdout, stderr) as raw bytes."""
+    import subprocess
+
     proc = subprocess.run(
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
         check=False,
         timeout=timeout_s,
     )
     return proc.returncode, proc.stdout, proc.stderr
 
 
-def _vcgencmd_get_throttled() -> dict[str, Any] | None:
+def _vcgencmd_path(cache: dict[str, Any], now_ms: int) -> str | None:
+    """Return the vcgencmd path, re-checking $PATH at most every VCGENCMD_CACHE_TTL_MS."""
+    entry = cache.get("vcgencmd")
+    if isinstance(entry, dict):
+        # a negative age means the clock stepped back; treat it as expired
+        age_ms = now_ms - (entry.get("checkedAtMs") or 0)
+        if 0 <= age_ms < VCGENCMD_CACHE_TTL_MS:
+            return entry.get("path")
+
+    import shutil
+
+    path = shutil.which("vcgencmd")
+    cache["vcgencmd"] = {"path": path, "checkedAtMs": now_ms}
+    return path
+
+
+def _parse_throttled(out: str) -> dict[str, Any] | None:
+    """Parse "throttled=0x50005" into flags."""
+    out = out.strip()
+    if "=" not in out:
+        return None
+    _k, v = out.split("=", 1)
+    v = v.strip()
+    # expected hex like 0x50005
+    try:
+        bits = int(v, 16)
+    except Exception:
+        return {"raw": out}
+
+    # Bits summary (current):
+    # 0: under-voltage
+    # 1: arm frequency capped
+    # 2: currently throttled
+    # 3: soft temp limit active
+    # (historical) 16..19 mirrors 0..3
+    def has(bit: int) -> bool:
+        return bool(bits & (1 << bit))
+
+    current = {
+        "underVoltage": has(0),
+        "freqCapped": has(1),
+        "throttled": has(2),
+        "softTempLimit": has(3),
+    }
+    past = {
+        "underVoltage": has(16),
+        "freqCapped": has(17),
+        "throttled": has(18),
+        "softTempLimit": has(19),
+    }
+
+    return {"raw": out, "hex": v, "bits": bits, "current": current, "past": past}
+
+
+def _vcgencmd_get_throttled(cache: dict[str, Any], now_ms: int) -> dict[str, Any] | None:
     """Return Raspberry Pi throttling info if vcgencmd is available.
 
     vcgencmd get_throttled -> e.g. "throttled=0x0"
     See: https://www.raspberrypi.com/documentation/computers/os.html#vcgencmd
+
+    The firmware sysfs node is preferred when present to avoid spawning a process.
     """
 
-    if shutil.which("vcgencmd") is None:
+    try:
+        raw = _read_proc(THROTTLED_SYSFS_PATH, 32).strip().decode("ascii")
+        if raw:
+            return _parse_throttled("throttled=0x" + raw)
+    except Exception:
+        pass
+
+    vcgencmd = _vcgencmd_path(cache, now_ms)
+    if vcgencmd is None:
         return None
 
     try:
-        code, out, _err = _run_cmd(["vcgencmd", "get_throttled"], timeout_s=5)
+        code, out, _err = _run_cmd([vcgencmd, "get_throttled"], timeout_s=5)
         if code != 0:
             return None
-        out = out.strip()
-        if "=" not in out:
-            return None
-        _k, v = out.split("=", 1)
-        v = v.strip()
-        # expected hex like 0x50005
-        try:
-            bits = int(v, 16)
-        except Exception:
-            return {"raw": out}
-
-        # Bits summary (current):
-        # 0: under-voltage
-        # 1: arm frequency capped
-        # 2: currently throttled
-        # 3: soft temp limit active
-        # (historical) 16..19 mirrors 0..3
-        def has(bit: int) -> bool:
-            return bool(bits & (1 << bit))
-
-        current = {
-            "underVoltage": has(0),
-            "freqCapped": has(1),
-            "throttled": has(2),
-            "softTempLimit": has(3),
-        }
-        past = {
-            "underVoltage": has(16),
-            "freqCapped": has(17),
-            "throttled": has(18),
-            "softTempLimit": has(19),
-        }
-
-        return {"raw": out, "hex": v, "bits": bits, "current": current, "past": past}
+        return _parse_throttled(out.decode("ascii", "replace"))
     except Exception:
         return None
 
 
-@dataclass
-class CpuSample:
+class CpuSample(NamedTuple):
     total: int
     idle: int
 
@@ -178,34 +336,57 @@ def _read_cpu_sample() -> CpuSample | None:
     """
 
     try:
-        first = _read_text("/proc/stat").splitlines()[0]
+        # The aggregate line comes first and is well under 256 bytes; skip the
+        # per-CPU/intr/softirq lines entirely.
+        first = _read_proc("/proc/stat", 256).split(b"\n", 1)[0]
         parts = first.split()
-        if not parts or parts[0] != "cpu":
+        if not parts or parts[0] != b"cpu":
             return None
-        nums = [int(x) for x in parts[1:] if x.isdigit()]
+        # Every field is a plain counter; int() rejects anything else and the
+        # sample is dropped by the except below.
+        nums = list(map(int, parts[1:]))
         if len(nums) < 5:
             return None
-        idle = nums[3] + (nums[4] if len(nums) > 4 else 0)
+        idle = nums[3] + nums[4]
         total = sum(nums)
         return CpuSample(total=total, idle=idle)
     except Exception:
         return None
 
 
-def _load_cpu_state() -> dict[str, Any] | None:
+def _load_cpu_state() -> CpuSample | None:
+    """Read the previous sample: three ASCII lines "atMs\ntotal\nidle\n"."""
     try:
-        with open(CPU_STATE_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+        _at_ms, total, idle = _read_bytes(CPU_STATE_PATH).split()[:3]
+        return CpuSample(total=int(total), idle=int(idle))
+    except FileNotFoundError:
+        return _migrate_legacy_cpu_state()
     except Exception:
         return None
 
 
+def _migrate_legacy_cpu_state() -> CpuSample | None:
+    """Read and remove the old JSON .cpu_state.json, if it is still around."""
+    try:
+        raw = _read_bytes(LEGACY_CPU_STATE_PATH)
+    except OSError:
+        return None
+    try:
+        os.unlink(LEGACY_CPU_STATE_PATH)
+    except OSError:
+        pass
+    try:
+        obj = _loads(raw)
+        total, idle = obj.get("total"), obj.get("idle")
+    except Exception:
+        return None
+    if not isinstance(total, int) or not isinstance(idle, int):
+        return None
+    return CpuSample(total=total, idle=idle)
+
+
 def _save_cpu_state(sample: CpuSample, at_ms: int) -> None:
-    tmp = CPU_STATE_PATH + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump({"atMs": at_ms, "total": sample.total, "idle": sample.idle}, f)
-        f.write("\n")
-    os.replace(tmp, CPU_STATE_PATH)
+    _write_atomic(CPU_STATE_PATH, b"%d\n%d\n%d\n" % (at_ms, sample.total, sample.idle))
 
 
 def _cpu_usage_pct(now: CpuSample | None, now_ms: int) -> float | None:
@@ -218,14 +399,8 @@ def _cpu_usage_pct(now: CpuSample | None, now_ms: int) -> float | None:
     if not prev:
         return None
 
-    prev_total = _safe_int(str(prev.get("total")))
-    prev_idle = _safe_int(str(prev.get("idle")))
-
-    if prev_total is None or prev_idle is None:
-        return None
-
-    total_delta = now.total - prev_total
-    idle_delta = now.idle - prev_idle
+    total_delta = now.total - prev.total
+    idle_delta = now.idle - prev.idle
     if total_delta <= 0:
         return None
 
@@ -238,18 +413,24 @@ def _cpu_usage_pct(now: CpuSample | None, now_ms: int) -> float | None:
     return round(usage, 1)
 
 
+def _meminfo_field(raw: bytes, key: bytes) -> int | None:
+    """Extract a "Key:   1234 kB" value from raw /proc/meminfo bytes."""
+    start = raw.find(key)
+    if start < 0:
+        return None
+    start += len(key)
+    end = raw.find(b"\n", start)
+    fields = raw[start:end if end >= 0 else None].split()
+    return _safe_int(fields[0]) if fields else None
+
+
 def _mem_info() -> dict[str, int] | None:
     """Return memory info in kB from /proc/meminfo (total/available)."""
     try:
-        meminfo = {}
-        for line in _read_text("/proc/meminfo").splitlines():
-            if ":" not in line:
-                continue
-            k, rest = line.split(":", 1)
-            meminfo[k.strip()] = rest.strip()
-
-        total_kb = _safe_int(meminfo.get("MemTotal", "").split()[0])
-        avail_kb = _safe_int(meminfo.get("MemAvailable", "").split()[0])
+        # ~1.5 KB in practice; MemTotal/MemAvailable are within the first lines.
+        raw = _read_proc("/proc/meminfo", 4096)
+        total_kb = _meminfo_field(raw, b"MemTotal:")
+        avail_kb = _meminfo_field(raw, b"MemAvailable:")
         if not total_kb or avail_kb is None:
             return None
         return {"totalKb": total_kb, "availableKb": avail_kb}
@@ -271,10 +452,13 @@ def _mem_usage_pct() -> float | None:
 
 def _disk_usage_pct(path: str = "/") -> float | None:
     try:
-        du = shutil.disk_usage(path)
-        if du.total <= 0:
+        # Same arithmetic as shutil.disk_usage(), without importing shutil.
+        st = os.statvfs(path)
+        total = st.f_blocks * st.f_frsize
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        if total <= 0:
             return None
-        pct = (du.used / du.total) * 100.0
+        pct = (used / total) * 100.0
         return round(pct, 1)
     except Exception:
         return None
@@ -283,7 +467,7 @@ def _disk_usage_pct(path: str = "/") -> float | None:
 def _uptime_seconds() -> int | None:
     try:
         # /proc/uptime: "12345.67 8910.11"
-        up = _read_text("/proc/uptime").split()[0]
+        up = _read_proc("/proc/uptime", 128).split()[0]
         v = _safe_float(up)
         if v is None:
             return None
@@ -296,28 +480,125 @@ def _load_history() -> dict[str, Any]:
     try:
         if not os.path.exists(HISTORY_PATH):
             return {"generatedAtMs": None, "retentionMs": HISTORY_RETENTION_MS, "points": []}
-        return json.loads(_read_text(HISTORY_PATH))
+        return _loads(_read_bytes(HISTORY_PATH))
     except Exception:
         return {"generatedAtMs": None, "retentionMs": HISTORY_RETENTION_MS, "points": []}
 
 
 def _save_history(obj: dict[str, Any]) -> None:
-    tmp = HISTORY_PATH + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False)
-        f.write("\n")
-    os.replace(tmp, HISTORY_PATH)
+    # Only rewritten on compaction, and holds up to 24h of points: worth a flush.
+    _write_atomic(HISTORY_PATH, _dumps(obj) + b"\n", sync=True)
 
 
-def _append_history(now_ms: int, system: dict[str, Any]) -> None:
-    """Append a single system snapshot to resource_history.json.
+def _read_history_tail() -> bytes:
+    try:
+        return _read_bytes(HISTORY_TAIL_PATH)
+    except Exception:
+        return b""
 
-    This file is intentionally small and stable for front-end charts.
-    """
+
+def _parse_history_tail(raw: bytes) -> list[dict[str, Any]]:
+    """Return the points in raw resource_history.ndjson bytes."""
+    points = []
+    for line in raw.splitlines():
+        try:
+            p = _loads(line)
+        except Exception:
+            continue
+        if isinstance(p, dict):
+            points.append(p)
+    return points
+
+
+def _last_tail_point(raw: bytes) -> dict[str, Any] | None:
+    """Parse only the last line of raw resource_history.ndjson bytes."""
+    try:
+        p = _loads(raw.rsplit(b"\n", 2)[-2])
+    except Exception:
+        return None
+    return p if isinstance(p, dict) else None
+
+
+def _append_history_tail(p: dict[str, Any]) -> None:
+    fd = os.open(HISTORY_TAIL_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, _dumps(p) + b"\n")
+    finally:
+        os.close(fd)
+
+
+def _first_point_at_or_after(points: list[dict[str, Any]], at_ms: int) -> int:
+    """Binary-search the index of the first point with atMs >= at_ms."""
+    lo, hi = 0, len(points)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        p = points[mid]
+        if ((p.get("atMs") or 0) if isinstance(p, dict) else 0) < at_ms:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _compact_history(now_ms: int, tail: list[dict[str, Any]]) -> None:
+    """Fold the NDJSON tail into resource_history.json and truncate the tail."""
 
     hist = _load_history()
     points = hist.get("points", []) or []
 
+    for p in tail:
+        at_ms = p.get("atMs") or 0
+        last_ms = (points[-1].get("atMs") or 0) if points else 0
+        # de-dup if the generator is triggered twice in the same ms; anything
+        # older was already folded in by an interrupted compaction.
+        if points and at_ms == last_ms:
+            points[-1] = p
+        elif at_ms > last_ms:
+            points.append(p)
+
+    # Points are appended in time order, so the expired ones form a prefix:
+    # drop it (and anything beyond the size cap) with a single slice.
+    cutoff = now_ms - HISTORY_RETENTION_MS
+    start = max(_first_point_at_or_after(points, cutoff), len(points) - HISTORY_MAX_POINTS)
+    if start > 0:
+        points = points[start:]
+
+    out = {
+        "generatedAtMs": now_ms,
+        "generatedAtIso": _iso(now_ms),
+        "retentionMs": HISTORY_RETENTION_MS,
+        "maxPoints": HISTORY_MAX_POINTS,
+        "points": points,
+    }
+    _save_history(out)
+    try:
+        os.truncate(HISTORY_TAIL_PATH, 0)
+    except FileNotFoundError:
+        pass
+
+
+def _is_redundant_point(prev: dict[str, Any], p: dict[str, Any]) -> bool:
+    prev_ms = prev.get("atMs") or 0
+    if prev_ms // HISTORY_BUCKET_MS != p["atMs"] // HISTORY_BUCKET_MS:
+        return False
+    for key in ("cpu", "mem"):
+        a, b = prev.get(key), p.get(key)
+        if a is None or b is None:
+            if a is not b:
+                return False
+        elif abs(a - b) >= HISTORY_MIN_DELTA_PCT:
+            return False
+    return True
+
+
+def _append_history(now_ms: int, system: dict[str, Any]) -> None:
+    """Append a single system snapshot to the resource history.
+
+    Each tick is an O(1) append to resource_history.ndjson; the full
+    resource_history.json is only rewritten every HISTORY_COMPACT_EVERY
+    points. Both files are intentionally small and stable for front-end charts.
+    """
+
     # only keep what we chart (avoid leaking large objects)
     p = {
         "atMs": now_ms,
@@ -328,49 +609,121 @@ def _append_history(now_ms: int, system: dict[str, Any]) -> None:
         "load1": (system.get("loadavg") or {}).get("1m"),
     }
 
-    # de-dup if the generator is triggered twice in the same ms
-    if points and points[-1].get("atMs") == now_ms:
-        points[-1] = p
+    # Only the line count and the last line are needed on a normal tick; the
+    # whole tail is parsed when it gets folded into the JSON.
+    raw = _read_history_tail()
+    prev = _last_tail_point(raw)
+    if prev is not None and _is_redundant_point(prev, p):
+        return
+    if raw.count(b"\n") + 1 >= HISTORY_COMPACT_EVERY or not os.path.exists(HISTORY_PATH):
+        tail = _parse_history_tail(raw)
+        tail.append(p)
+        _compact_history(now_ms, tail)
     else:
-        points.append(p)
+        _append_history_tail(p)
+
+
+def _normalize_job(j: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a `clawdbot cron list` job to the fields the dashboard shows."""
+    state = j.get("state") or {}
+    schedule = j.get("schedule") or {}
+    last_ms = state.get("lastRunAtMs")
+    next_ms = state.get("nextRunAtMs")
+
+    return {
+        "id": j.get("id"),
+        "name": j.get("name"),
+        "enabled": bool(j.get("enabled")),
+        "schedule": {
+            "kind": schedule.get("kind"),
+            "expr": schedule.get("expr"),
+        },
+        "lastRun": {
+            "status": state.get("lastStatus"),
+            "atMs": last_ms,
+            "atIso": _iso(last_ms),
+            "durationMs": state.get("lastDurationMs"),
+            "error": state.get("lastError"),
+        },
+        "nextRun": {
+            "atMs": next_ms,
+            "atIso": _iso(next_ms),
+        },
+    }
 
-    cutoff = now_ms - HISTORY_RETENTION_MS
-    points = [x for x in points if isinstance(x, dict) and (x.get("atMs") or 0) >= cutoff]
-    if len(points) > HISTORY_MAX_POINTS:
-        points = points[-HISTORY_MAX_POINTS:]
 
-    out = {
-        "generatedAtMs": now_ms,
-        "generatedAtIso": _iso(now_ms),
-        "retentionMs": HISTORY_RETENTION_MS,
-        "maxPoints": HISTORY_MAX_POINTS,
-        "points": points,
-    }
-    _save_history(out)
+def _parse_args(argv: list[str]) -> tuple[bool, float | None]:
+    """Return (history_only, skip_if_fresh) from the command line."""
+    # The usual timer invocation has no arguments; don't pay for argparse then.
+    if not argv:
+        return False, None
 
+    import argparse
 
-def main() -> int:
-    generated_at_ms = int(time.time() * 1000)
+    parser = argparse.ArgumentParser(description="Generate cron_status.json for the static dashboard.")
+    parser.add_argument(
+        "--history-only",
+        action="store_true",
+        help="only update the resource history; skip the clawdbot cron query",
+    )
+    parser.add_argument(
+        "--skip-if-fresh",
+        type=float,
+        metavar="SECONDS",
+        help="do nothing if the output was updated within SECONDS",
+    )
+    args = parser.parse_args(argv)
+    return args.history_only, args.skip_if_fresh
 
-    cron_cmd = ["clawdbot", "cron", "list", "--all", "--json"]
+
+def _newest_mtime(paths: list[str]) -> float | None:
+    newest = None
+    for path in paths:
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            continue
+        if newest is None or mtime > newest:
+            newest = mtime
+    return newest
+
+
+def main(argv: list[str] | None = None) -> int:
+    history_only, skip_if_fresh = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    if skip_if_fresh is not None:
+        # History is written to the NDJSON tail on most ticks, the JSON on compaction.
+        watched = [HISTORY_PATH, HISTORY_TAIL_PATH] if history_only else [OUT_PATH]
+        mtime = _newest_mtime(watched)
+        if mtime is not None and time.time() - mtime < skip_if_fresh:
+            return 0
+
+    generated_at_ms = int(time.time() * 1000)
 
     # --- system snapshot ---
+    host_cache = _load_host_cache()
+    host_cache_before = dict(host_cache)
     cpu_sample = _read_cpu_sample()
     mem = _mem_info()
+    # One uname() call covers what platform.node/system/release/machine report.
+    uname = os.uname()
     system = {
-        "hostname": platform.node() or None,
-        "os": platform.system() or None,
-        "release": platform.release() or None,
-        "arch": platform.machine() or None,
+        "hostname": uname.nodename or None,
+        "os": uname.sysname or None,
+        "release": uname.release or None,
+        "arch": uname.machine or None,
         "uptimeSec": _uptime_seconds(),
         "loadavg": _loadavg(),
-        "cpuTempC": _cpu_temp_c(),
-        "throttling": _vcgencmd_get_throttled(),
+        "cpuTempC": _cpu_temp_c(host_cache, generated_at_ms),
+        # not charted, and may spawn vcgencmd
+        "throttling": None if history_only else _vcgencmd_get_throttled(host_cache, generated_at_ms),
         "cpuUsagePct": _cpu_usage_pct(cpu_sample, generated_at_ms),
         "memUsagePct": _mem_usage_pct(),
         "mem": mem,
         "diskUsagePct": _disk_usage_pct("/"),
     }
+    if host_cache != host_cache_before:
+        _save_host_cache(host_cache)
 
     # Always try to update the history; failures should not break the main JSON.
     try:
@@ -378,49 +731,26 @@ def main() -> int:
     except Exception:
         pass
 
+    if history_only:
+        return 0
+
     # --- cron ---
     try:
         # cron の取得は CLI の状態次第で遅くなることがあるため、短めにタイムアウト。
         # 失敗時は直前の cron_status.json を読み込んで "stale" 扱いにする。
-        code, out, err = _run_cmd(cron_cmd, timeout_s=20)
+        code, out, err = _run_cmd(CRON_CMD, timeout_s=20)
         if code != 0:
-            raise RuntimeError(err.strip() or f"cron list failed: {code}")
+            raise RuntimeError(err.decode("utf-8", "replace").strip() or f"cron list failed: {code}")
 
-        raw = json.loads(out)
+        raw = _loads(out)
         jobs = raw.get("jobs", []) or []
 
-        normalized_jobs = []
-        for j in jobs:
-            state = j.get("state") or {}
-            schedule = j.get("schedule") or {}
-
-            normalized_jobs.append(
-                {
-                    "id": j.get("id"),
-                    "name": j.get("name"),
-                    "enabled": bool(j.get("enabled")),
-                    "schedule": {
-                        "kind": schedule.get("kind"),
-                        "expr": schedule.get("expr"),
-                    },
-                    "lastRun": {
-                        "status": state.get("lastStatus"),
-                        "atMs": state.get("lastRunAtMs"),
-                        "atIso": _iso(state.get("lastRunAtMs")),
-                        "durationMs": state.get("lastDurationMs"),
-                        "error": state.get("lastError"),
-                    },
-                    "nextRun": {
-                        "atMs": state.get("nextRunAtMs"),
-                        "atIso": _iso(state.get("nextRunAtMs")),
-                    },
-                }
-            )
+        normalized_jobs = [_normalize_job(j) for j in jobs]
 
         out_obj: dict[str, Any] = {
             "generatedAtMs": generated_at_ms,
             "generatedAtIso": _iso(generated_at_ms),
-            "source": {"command": " ".join(cron_cmd)},
+            "source": {"command": CRON_CMD_STR},
             "system": system,
             "jobs": normalized_jobs,
         }
@@ -432,7 +762,7 @@ def main() -> int:
         prev_generated_at_iso: str | None = None
         try:
             if os.path.exists(OUT_PATH):
-                prev = json.loads(_read_text(OUT_PATH))
+                prev = _loads(_read_bytes(OUT_PATH))
                 prev_jobs = prev.get("jobs", []) or []
                 prev_generated_at_iso = prev.get("generatedAtIso")
         except Exception:
@@ -449,12 +779,9 @@ def main() -> int:
             "jobs": prev_jobs,
         }
 
-    tmp_path = OUT_PATH + ".tmp"
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(out_obj, f, ensure_ascii=False, indent=2)
-        f.write("\n")
-
-    os.replace(tmp_path, OUT_PATH)
+    # Compact by default; set DEBUG=1 for human-readable output.
+    debug = os.environ.get("DEBUG", "").strip().lower() not in ("", "0", "false", "no", "off")
+    _write_atomic(OUT_PATH, _dumps(out_obj, indent=debug) + b"\n")
     return 0
 
 